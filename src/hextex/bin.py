@@ -1,39 +1,95 @@
+import mmap
 import os
-import pathlib
 
 
 class BinFile:
     path: str
     offset: int
     size: int
-    data: bytes
+    data: memoryview
+    _fd: int
+    _mm: mmap.mmap | None
+    _mv: memoryview
 
     def __init__(self, filepath: str):
-        self.path = pathlib.Path(filepath).resolve().as_posix()
-        # get the number of bytes in the file.
+        self.path = os.path.abspath(filepath)
+        # one stat covers both the existence check and the byte count;
+        # resolve() would stat every path component again
         self.offset = int(0)
-        self.data = bytes()
-        self.size = os.path.getsize(filepath)
+        self.data = memoryview(b"")
+        self.size = os.stat(filepath).st_size
+        # Map the file once so chunk reads become pointer arithmetic into the
+        # page cache instead of an open/seek/read cycle per call.
+        self._fd = os.open(self.path, os.O_RDONLY)
+        if self.size > 0:
+            try:
+                self._mm = mmap.mmap(self._fd, 0, access=mmap.ACCESS_READ)
+                self._mv = memoryview(self._mm)
+            except OSError:
+                # some filesystems refuse to map; pread on the kept
+                # descriptor serves reads instead
+                self._mm = None
+                self._mv = memoryview(b"")
+        else:
+            # mmap cannot map an empty file
+            self._mm = None
+            self._mv = memoryview(b"")
 
-    def load_chunk(self, offset: int, count: int) -> bytes:
+    def load_chunk(self, offset: int, count: int) -> memoryview:
         """
         Loads a section of the file from an offset for the
         given number of bytes up to the limit of the file
         """
-        # For now return random data
-        # return random.randbytes(count)
-        with open(self.path, "rb") as file:
-            file.seek(offset)
-            data = file.read(count)
-            return data
+        if self._mm is None:
+            # pread needs no seek and leaves the descriptor state alone
+            return memoryview(os.pread(self._fd, count, offset))
+        return self._mv[offset : offset + count]
 
     def save_chunk(self, offset: int, data: bytes) -> bool:
-        with open(self.path, "w+b") as file:
-            file.seek(offset)
-            file.write(data)
-            return True
+        fd = os.open(self.path, os.O_RDWR)
+        try:
+            os.pwrite(fd, data, offset)
+        finally:
+            os.close(fd)
+        return True
+
+    def prefetch(self, offset: int, count: int) -> None:
+        """
+        Hints the kernel to page in a region ahead of use so a jump into a
+        cold part of a large file does not stall on the first touch
+        """
+        if self._mm is None or not hasattr(mmap, "MADV_WILLNEED"):
+            return
+        # madvise requires a page-aligned starting offset
+        start = (offset // mmap.PAGESIZE) * mmap.PAGESIZE
+        length = min(self.size, offset + count) - start
+        if length > 0:
+            self._mm.madvise(mmap.MADV_WILLNEED, start, length)
 
     def load(self) -> None:
-        with open(self.path, "rb") as file:
-            # the whole thing, all at once!
-            self.data = file.read()
+        # the mapping already covers the whole file; expose it so callers
+        # slice the page cache directly instead of a private copy
+        if self._mm is None and self.size > 0:
+            # unmappable file: one bulk pread stands in for the mapping
+            self.data = memoryview(os.pread(self._fd, self.size, 0))
+        else:
+            self.data = self._mv
+
+    def close(self) -> None:
+        """Release the mapping and the file descriptor."""
+        self._mv.release()
+        self._mv = memoryview(b"")
+        self.data = memoryview(b"")
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except (AttributeError, BufferError, OSError):
+            # a caller may still hold a slice of the mapping at teardown
+            pass